@@ -1,70 +1,95 @@
+import io
 import os
+import re
 import json
-from datetime import datetime, timezone, timedelta
-from anthropic import Anthropic
-from slack_sdk import WebClient
+import time
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
 from slack_sdk.errors import SlackApiError
 
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 # 環境変数から認証情報を取得
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 SLACK_USER_TOKEN = os.environ.get("SLACK_USER_TOKEN")  # User Token (xoxp-)
 
-client = Anthropic(api_key=ANTHROPIC_API_KEY)
-slack_client = WebClient(token=SLACK_USER_TOKEN)
+# 重いSDK（特にanthropicはhttpx/pydanticを引き込む）は初回利用時までimportを遅延
+_claude_client = None
+_slack_client = None
+_async_slack_client = None
 
-def get_my_user_id():
-    """自分のユーザーIDを取得"""
+def _get_claude_client():
+    global _claude_client
+    if _claude_client is None:
+        from anthropic import AsyncAnthropic
+        _claude_client = AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+    return _claude_client
+
+def _get_slack_client():
+    global _slack_client
+    if _slack_client is None:
+        from slack_sdk import WebClient
+        _slack_client = WebClient(token=SLACK_USER_TOKEN, timeout=30)
+    return _slack_client
+
+_async_session = None
+
+def _get_async_slack_client():
+    global _async_slack_client, _async_session
+    if _async_slack_client is None:
+        import aiohttp
+        from slack_sdk.web.async_client import AsyncWebClient
+        # keep-aliveの共有セッションで全呼び出しのTCP+TLSハンドシェイクを1回に抑える
+        _async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=SLACK_CONCURRENCY,
+                keepalive_timeout=60
+            )
+        )
+        _async_slack_client = AsyncWebClient(
+            token=SLACK_USER_TOKEN, timeout=30, session=_async_session)
+    return _async_slack_client
+
+async def _close_async_session():
+    """共有セッションをクローズ（未使用なら何もしない）"""
+    if _async_session is not None:
+        await _async_session.close()
+
+# チャンネル並列取得の同時接続数上限
+SLACK_CONCURRENCY = 64
+
+def _jst_timestamp():
+    """日本時間(JST = UTC+9)の現在時刻ラベル"""
+    return time.strftime("%Y/%m/%d %H:%M", time.gmtime(time.time() + 9 * 3600))
+
+# user_id / DMチャンネルIDのディスクキャッシュ（毎回のAPI呼び出しを省略）
+CACHE_PATH = Path.home() / ".cache" / "slack_task_organizer.json"
+
+def _load_cache():
+    """ディスクキャッシュを読み込む（壊れていれば空として扱う）"""
     try:
-        response = slack_client.auth_test()
-        return response["user_id"]
-    except SlackApiError as e:
-        print(f"ユーザーID取得エラー: {e.response['error']}")
-        return None
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-def get_mentions_last_24h(user_id):
-    """過去24時間の自分宛メンションを取得"""
+def _save_cache(cache):
+    """ディスクキャッシュを書き込む"""
     try:
-        # 24時間前のタイムスタンプ
-        oldest = (datetime.now() - timedelta(hours=24)).timestamp()
-        
-        # 自分へのメンションを検索
-        result = slack_client.search_messages(
-            query=f"<@{user_id}>",
-            sort="timestamp",
-            sort_dir="desc",
-            count=100
-        )
-        
-        mentions = []
-        for match in result["messages"]["matches"]:
-            msg_timestamp = float(match["ts"])
-            if msg_timestamp >= oldest:
-                mentions.append({
-                    "text": match["text"],
-                    "user": match.get("username", "Unknown User"),
-                    "channel": match.get("channel", {}).get("name", "Unknown Channel"),
-                    "timestamp": match["ts"],
-                    "permalink": match.get("permalink", "")
-                })
-        
-        return mentions
-    
-    except SlackApiError as e:
-        print(f"Slack API Error: {e.response['error']}")
-        return []
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # キャッシュが書けなくても動作には影響しない
 
-def analyze_with_claude(mentions):
-    """Claudeでメンションをタスクとして分析・整理"""
-    if not mentions:
-        return "過去24時間にメンションはありませんでした。"
-    
-    # メンション情報をテキストに整形（簡潔に）
-    mentions_text = "\n\n".join([
-        f"[{i+1}] {m['user']} in #{m['channel']}\n{m['text']}"
-        for i, m in enumerate(mentions)
-    ])
-    
-    prompt = f"""以下は過去24時間にあなた宛に送られたSlackのメンション一覧です。
+# 静的な指示部分（毎回同一のバイト列にしてプロンプトキャッシュを効かせる）
+STATIC_INSTRUCTIONS = """以下は過去24時間にあなた宛に送られたSlackのメンション一覧です。
 これらのメンションを以下の形式で要約してください：
 
 【重要な指示】
@@ -88,9 +113,6 @@ def analyze_with_claude(mentions):
    ・日程調整
    など
 
-メンション一覧：
-{mentions_text}
-
 ※出力例※
 📊 全体サマリー
 過去24時間で78件のメンションがありました。生成AI関連の運用ルール策定と経理関連の確認が急務です。
@@ -103,7 +125,7 @@ def analyze_with_claude(mentions):
   https://example.slack.com/...
 
 • 委託販売契約書の提出
-  tokita（経理）より  
+  tokita（経理）より
   監査法人対応のため契約書提示が必要
   https://example.slack.com/...
 
@@ -122,38 +144,308 @@ def analyze_with_claude(mentions):
 
 情報共有：
 • AIマーケティングカンファレンス動画共有
-• 座席配置変更のお知らせ"""
-    
+• 座席配置変更のお知らせ
+
+最後に「---END---」と出力してください。"""
+
+def get_my_user_id():
+    """自分のユーザーIDを取得"""
+    try:
+        response = _get_slack_client().auth_test()
+        return response["user_id"]
+    except SlackApiError as e:
+        logger.error("ユーザーID取得エラー: %s", e.response["error"])
+        return None
+
+async def _slack_call_with_retry(method, **kwargs):
+    """Slack APIを呼び出し、429はRetry-Afterを尊重して指数バックオフで再試行"""
+    delay = 1
+    for attempt in range(5):
+        try:
+            return await method(**kwargs)
+        except SlackApiError as e:
+            if e.response.status_code == 429 and attempt < 4:
+                retry_after = int(e.response.headers.get("Retry-After", delay))
+                await asyncio.sleep(retry_after)
+                delay *= 2
+            else:
+                raise
+
+async def _list_my_channels():
+    """自分が参加しているチャンネルを列挙（カーソルでページング）"""
+    channels = []
+    cursor = None
+    while True:
+        response = await _slack_call_with_retry(
+            _get_async_slack_client().users_conversations,
+            types="public_channel,private_channel,mpim,im",
+            exclude_archived=True,
+            limit=200,
+            cursor=cursor
+        )
+        channels.extend(response["channels"])
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+    return channels
+
+# ユーザー宛メンション判定の正規表現（user_idごとにコンパイル結果をキャッシュ）
+_mention_res = {}
+
+def _mention_re(user_id):
+    regex = _mention_res.get(user_id)
+    if regex is None:
+        regex = _mention_res[user_id] = re.compile(rf"<@{re.escape(user_id)}>")
+    return regex
+
+async def _fetch_channel_mentions(sem, channel, user_id, oldest):
+    """1チャンネル分の履歴を取得し、自分宛メンションだけを抽出（カーソルでページング）"""
+    mention_re = _mention_re(user_id)
+    mentions = []
+    cursor = None
+    while True:
+        async with sem:
+            response = await _slack_call_with_retry(
+                _get_async_slack_client().conversations_history,
+                channel=channel["id"],
+                oldest=str(oldest),
+                limit=200,
+                cursor=cursor
+            )
+
+        for message in response["messages"]:
+            if mention_re.search(message.get("text", "")):
+                mentions.append({
+                    "text": message["text"],
+                    "user": message.get("user", "Unknown User"),
+                    "channel": channel.get("name", "DM"),
+                    "channel_id": channel["id"],
+                    "timestamp": message["ts"],
+                    "permalink": ""
+                })
+
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not response.get("has_more") or not cursor:
+            break
+    return mentions
+
+async def _resolve_names_and_permalinks(sem, mentions):
+    """投稿者の表示名とパーマリンクを並列で解決"""
+    async def resolve_user(uid):
+        try:
+            async with sem:
+                response = await _slack_call_with_retry(_get_async_slack_client().users_info, user=uid)
+            profile = response["user"]
+            return uid, profile.get("real_name") or profile.get("name", uid)
+        except SlackApiError:
+            return uid, uid  # 退会済み・外部ユーザーなどはIDのまま報告する
+
+    async def resolve_permalink(mention):
+        try:
+            async with sem:
+                response = await _slack_call_with_retry(
+                    _get_async_slack_client().chat_getPermalink,
+                    channel=mention["channel_id"],
+                    message_ts=mention["timestamp"]
+                )
+            mention["permalink"] = response["permalink"]
+        except SlackApiError:
+            pass  # パーマリンクが取れなくても本文は報告できる
+
+    user_ids = {m["user"] for m in mentions if m["user"] != "Unknown User"}
+    name_pairs = await asyncio.gather(*[resolve_user(uid) for uid in user_ids])
+    names = dict(name_pairs)
+    for mention in mentions:
+        mention["user"] = names.get(mention["user"], mention["user"])
+
+    await asyncio.gather(*[resolve_permalink(m) for m in mentions])
+
+async def get_mentions_last_24h(user_id):
+    """過去24時間の自分宛メンションを取得（全チャンネルの履歴を並列取得）"""
+    try:
+        # 24時間前のタイムスタンプ
+        oldest = time.time() - 86400
+
+        channels = await _list_my_channels()
+        sem = asyncio.Semaphore(SLACK_CONCURRENCY)
+        results = await asyncio.gather(*[
+            _fetch_channel_mentions(sem, channel, user_id, oldest)
+            for channel in channels
+        ])
+        mentions = [m for channel_mentions in results for m in channel_mentions]
+
+        await _resolve_names_and_permalinks(sem, mentions)
+        mentions.sort(key=lambda m: float(m["timestamp"]), reverse=True)
+        return mentions
+
+    except SlackApiError as e:
+        logger.error("Slack API Error: %s", e.response["error"])
+        return []
+
+# LLMを介さず「情報共有のみ」に直行させてよい定型メンションのパターン
+TRIVIAL_PATTERNS = [re.compile(p) for p in (
+    r"github\.com/[^\s|>]+/pull/",
+    r"デプロイ(が|は)?完了",
+    r"CI.*(passed|success|成功)",
+    r"<!channel>",
+    r"<!here>",
+)]
+
+def _split_trivial_mentions(mentions):
+    """定型パターンに一致する自明なメンションをLLM対象から分離する
+
+    CI通知やデプロイ完了報告、@channel一斉連絡などは分類結果が自明なので、
+    Claudeに送らずローカルで「情報共有のみ」へ振り分け、プロンプトを
+    曖昧な残りだけに絞る。
+    """
+    trivial = []
+    needs_llm = []
+    for mention in mentions:
+        if any(p.search(mention["text"]) for p in TRIVIAL_PATTERNS):
+            trivial.append(mention)
+        else:
+            needs_llm.append(mention)
+    return trivial, needs_llm
+
+def _format_trivial_section(trivial):
+    """ローカル分類したメンションをレポート末尾用のセクションに整形"""
+    lines = ["⚪ 情報共有のみ（自動分類）", ""]
+    for mention in trivial:
+        lines.append(f"• {mention['user']}（{mention['channel']}）")
+        if mention["permalink"]:
+            lines.append(f"  {mention['permalink']}")
+    return "\n".join(lines)
+
+def _dedupe_mentions(mentions):
+    """本文がほぼ同一のメンションを1件に集約し、重複数を付記する
+
+    編集による再投稿やスレッドのエコーで同じ内容が複数返ることがあるため、
+    空白を正規化した本文のハッシュで重複を検出し、入力トークンを削減する。
+    """
+    seen = {}
+    deduped = []
+    for mention in mentions:
+        normalized = re.sub(r"\s+", " ", mention["text"]).strip().lower()
+        key = hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+        if key in seen:
+            seen[key]["count"] += 1
+        else:
+            entry = dict(mention, count=1)
+            seen[key] = entry
+            deduped.append(entry)
+
+    for mention in deduped:
+        if mention["count"] > 1:
+            mention["text"] += f"（×{mention['count']}）"
+    return deduped
+
+async def analyze_with_claude(mentions, section_queue):
+    """Claudeでメンションを分析し、完成したセクションから順にキューへ流す
+
+    生成をストリーミングで受け取り、"\\n\\n"区切りのセクションが確定するたびに
+    section_queueへ渡す。送信側コルーチンと並走させることで、Claudeの生成と
+    SlackのHTTP往復をオーバーラップできる。終端はNoneで通知する。
+    """
+    # 重複を畳み込み、定型メンションはローカル分類してLLM対象を絞る
+    mentions = _dedupe_mentions(mentions)
+    trivial, needs_llm = _split_trivial_mentions(mentions)
+
+    if not needs_llm:
+        # 全件が定型ならClaude呼び出し自体を省略
+        if trivial:
+            await section_queue.put(_format_trivial_section(trivial))
+        await section_queue.put(None)
+        return
+
+    # 中間リストを作らずStringIOへ直接書き込む
+    buf = io.StringIO()
+    for i, m in enumerate(needs_llm):
+        buf.write(f"[{i+1}] {m['user']} in #{m['channel']}\n")
+        buf.write(m["text"])
+        buf.write("\n\n")
+    mentions_text = buf.getvalue().rstrip("\n")
+
     try:
-        message = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=2000,
+        buffer = ""
+        async with _get_claude_client().messages.stream(
+            model="claude-haiku-4-5",
+            max_tokens=1200,
+            temperature=0,
+            stop_sequences=["---END---"],
+            # 静的な指示はsystemブロックに置き、cache_controlでプレフィックスキャッシュ
+            system=[{
+                "type": "text",
+                "text": STATIC_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"}
+            }],
             messages=[{
                 "role": "user",
-                "content": prompt
+                "content": f"メンション一覧：\n{mentions_text}"
             }]
-        )
-        
-        return message.content[0].text
-    
+        ) as stream:
+            async for text in stream.text_stream:
+                buffer += text
+                while "\n\n" in buffer:
+                    section, buffer = buffer.split("\n\n", 1)
+                    if section.strip():
+                        await section_queue.put(section.strip())
+            message = await stream.get_final_message()
+
+        if buffer.strip():
+            await section_queue.put(buffer.strip())
+
+        # キャッシュのヒット状況を確認できるよう出力
+        usage = message.usage
+        logger.info("🔄 cache read: %dトークン / cache write: %dトークン / output: %dトークン",
+                    getattr(usage, "cache_read_input_tokens", 0),
+                    getattr(usage, "cache_creation_input_tokens", 0),
+                    usage.output_tokens)
+
     except Exception as e:
-        print(f"Claude API Error: {e}")
-        return "タスクの分析中にエラーが発生しました。"
+        logger.error("Claude API Error: %s", e)
+        await section_queue.put("タスクの分析中にエラーが発生しました。")
+
+    finally:
+        # ローカル分類分はClaudeの出力の後ろに連結する
+        if trivial:
+            await section_queue.put(_format_trivial_section(trivial))
+        await section_queue.put(None)
+
+async def _open_dm_channel(user_id, cache):
+    """自分とのDMチャンネルIDを取得（ディスクキャッシュ優先）"""
+    cached = cache.get("dm_channels", {}).get(user_id)
+    if cached:
+        return cached, True
+
+    # User Tokenを使う場合、自分とのDMチャンネルを開く
+    response = await _slack_call_with_retry(
+        _get_async_slack_client().conversations_open, users=[user_id])
+    dm_channel_id = response["channel"]["id"]
+    cache.setdefault("dm_channels", {})[user_id] = dm_channel_id
+    _save_cache(cache)
+    return dm_channel_id, False
+
+async def _post_messages(dm_channel_id, messages):
+    """各チャンクを並列送信（表示順はSlack側のts順で保たれる）"""
+    await asyncio.gather(*[
+        _slack_call_with_retry(
+            _get_async_slack_client().chat_postMessage,
+            channel=dm_channel_id,
+            text=msg,
+            mrkdwn=True,
+            unfurl_links=False,  # リンクプレビューを無効化
+            unfurl_media=False
+        )
+        for msg in messages
+    ])
 
-def send_dm_to_self(organized_tasks, user_id):
+async def send_dm_to_self(organized_tasks, user_id, cache, dm_channel_task):
     """整理したタスクを自分にDMで送信（User Tokenで自分にメッセージ）"""
     try:
-        # User Tokenを使う場合、自分とのDMチャンネルを開く
-        response = slack_client.conversations_open(users=[user_id])
-        dm_channel_id = response["channel"]["id"]
-        
+
         # メッセージを送信（Slackの制限: 40,000文字だが、安全のため3,900文字で分割）
 
-        # 日本時間(JST = UTC+9)に変換
-        jst = timezone(timedelta(hours=9))
-        timestamp = datetime.now(jst).strftime("%Y/%m/%d %H:%M")
-        # timestamp = datetime.now().strftime("%Y/%m/%d %H:%M")
-        header = f"📋 タスク整理レポート ({timestamp})\n\n"
+        header = f"📋 タスク整理レポート ({_jst_timestamp()})\n\n"
         
         max_length = 3900
         messages = []
@@ -161,60 +453,134 @@ def send_dm_to_self(organized_tasks, user_id):
         if len(organized_tasks) <= max_length:
             messages.append(header + organized_tasks)
         else:
-            # 緊急度ごとに分割して送信
+            # 緊急度ごとに分割して送信（逐次連結はO(N^2)になるのでリスト+joinで組み立てる）
             sections = organized_tasks.split('\n\n')
-            current_message = header
-            
+            buf = [header]
+            buf_length = len(header)
+
             for section in sections:
-                if len(current_message) + len(section) + 2 <= max_length:
-                    current_message += section + "\n\n"
-                else:
-                    messages.append(current_message.strip())
-                    current_message = section + "\n\n"
-            
-            if current_message.strip():
-                messages.append(current_message.strip())
-        
-        # メッセージを順次送信
-        for i, msg in enumerate(messages):
-            if i > 0:
-                # 2つ目以降のメッセージには続きであることを示す
-                msg = f"（続き {i+1}/{len(messages)}）\n\n" + msg
-            
-            slack_client.chat_postMessage(
-                channel=dm_channel_id,
-                text=msg,
-                mrkdwn=True,
-                unfurl_links=False,  # リンクプレビューを無効化
-                unfurl_media=False
-            )
-        
-        print(f"✅ DMの送信に成功しました（{len(messages)}件）")
+                section_length = len(section) + 2
+                if buf_length + section_length > max_length and buf:
+                    messages.append("".join(buf).strip())
+                    buf = []
+                    buf_length = 0
+                buf.append(section)
+                buf.append("\n\n")
+                buf_length += section_length
+
+            remainder = "".join(buf).strip()
+            if remainder:
+                messages.append(remainder)
         
+        # 2つ目以降には続きラベルを本文側に付与（送信完了順に依存しない）
+        messages = [
+            msg if i == 0 else f"（続き {i+1}/{len(messages)}）\n\n{msg}"
+            for i, msg in enumerate(messages)
+        ]
+
+        dm_channel_id, from_cache = await dm_channel_task
+        try:
+            await _post_messages(dm_channel_id, messages)
+        except SlackApiError:
+            if not from_cache:
+                raise
+            # キャッシュしたチャンネルIDが無効になった可能性があるので取り直して一度だけ再試行
+            cache.get("dm_channels", {}).pop(user_id, None)
+            _save_cache(cache)
+            dm_channel_id, _ = await _open_dm_channel(user_id, cache)
+            await _post_messages(dm_channel_id, messages)
+
+        logger.info("✅ DMの送信に成功しました（%d件）", len(messages))
+
     except SlackApiError as e:
-        print(f"DM送信エラー: {e.response['error']}")
+        logger.error("DM送信エラー: %s", e.response["error"])
 
-def main():
+async def stream_report_to_dm(section_queue, user_id, cache, dm_channel_task):
+    """キューから受け取ったセクションを確定し次第DMで送信
+
+    analyze_with_claudeと並走する消費側。ヘッダーを先に送り、以降は
+    セクション単位で順次投稿するので、生成完了を待たずにレポートが
+    届き始める。
+    """
+    try:
+        dm_channel_id, from_cache = await dm_channel_task
+
+        async def post(message):
+            nonlocal dm_channel_id, from_cache
+            try:
+                await _post_messages(dm_channel_id, [message])
+            except SlackApiError:
+                if not from_cache:
+                    raise
+                # キャッシュしたチャンネルIDが無効になった可能性があるので取り直して一度だけ再試行
+                cache.get("dm_channels", {}).pop(user_id, None)
+                _save_cache(cache)
+                dm_channel_id, from_cache = await _open_dm_channel(user_id, cache)
+                await _post_messages(dm_channel_id, [message])
+
+        await post(f"📋 タスク整理レポート ({_jst_timestamp()})")
+
+        sent = 1
+        while True:
+            section = await section_queue.get()
+            if section is None:
+                break
+            await post(section)
+            sent += 1
+
+        logger.info("✅ DMの送信に成功しました（%d件）", sent)
+
+    except SlackApiError as e:
+        logger.error("DM送信エラー: %s", e.response["error"])
+        # 送信できなくても生成側が詰まらないようキューを読み捨てる
+        while await section_queue.get() is not None:
+            pass
+
+async def main_async():
     """メイン処理"""
-    print("👤 ユーザー情報を取得中...")
-    user_id = get_my_user_id()
-    if not user_id:
-        print("❌ ユーザーIDの取得に失敗しました")
+    try:
+        await _run()
+    finally:
+        await _close_async_session()
+
+async def _run():
+    logger.info("👤 ユーザー情報を取得中...")
+    cache = _load_cache()
+    user_id = cache.get("user_id")
+    if user_id:
+        logger.info("✅ User ID: %s（キャッシュ）", user_id)
+    else:
+        user_id = get_my_user_id()
+        if not user_id:
+            logger.error("❌ ユーザーIDの取得に失敗しました")
+            return
+        cache["user_id"] = user_id
+        _save_cache(cache)
+        logger.info("✅ User ID: %s", user_id)
+
+    logger.info("🔍 過去24時間のメンションを取得中...")
+    # DMチャンネルの解決はメンション取得とRTTを重ねられるので先に発行しておく
+    dm_channel_task = asyncio.create_task(_open_dm_channel(user_id, cache))
+    mentions = await get_mentions_last_24h(user_id)
+    logger.info("📊 %d件のメンションを検出", len(mentions))
+
+    if not mentions:
+        await send_dm_to_self("過去24時間にメンションはありませんでした。",
+                              user_id, cache, dm_channel_task)
+        logger.info("✨ 完了しました！")
         return
-    
-    print(f"✅ User ID: {user_id}")
-    
-    print("🔍 過去24時間のメンションを取得中...")
-    mentions = get_mentions_last_24h(user_id)
-    print(f"📊 {len(mentions)}件のメンションを検出")
-    
-    print("🤖 Claudeでタスクを分析中...")
-    organized_tasks = analyze_with_claude(mentions)
-    
-    print("📤 整理したタスクをDMで送信中...")
-    send_dm_to_self(organized_tasks, user_id)
-    
-    print("✨ 完了しました！")
+
+    logger.info("🤖 Claudeでタスクを分析し、DMで送信中...")
+    section_queue = asyncio.Queue()
+    await asyncio.gather(
+        analyze_with_claude(mentions, section_queue),
+        stream_report_to_dm(section_queue, user_id, cache, dm_channel_task)
+    )
+
+    logger.info("✨ 完了しました！")
+
+def main():
+    asyncio.run(main_async())
 
 if __name__ == "__main__":
     main()